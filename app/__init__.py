@@ -1,10 +1,62 @@
+from zlib import crc32
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import inspect, text
+from sqlalchemy import event, inspect, text
 
 
 db = SQLAlchemy()
 
+_GAME_COLUMN_DEFINITIONS = {
+    "purchase_date": "DATE",
+    "start_date": "DATE",
+    "finish_date": "DATE",
+    "thoughts": "TEXT",
+    "price_amount": "REAL",
+    "price_currency": "VARCHAR(8)",
+    "purchase_price_amount": "REAL",
+    "purchase_price_currency": "VARCHAR(8)",
+}
+
+
+_INDEX_DEFINITIONS = {
+    "idx_games_lifecycle": (
+        "CREATE INDEX IF NOT EXISTS idx_games_lifecycle"
+        " ON games (status, start_date, purchase_date)"
+    ),
+    "idx_session_logs_game_id": (
+        "CREATE INDEX IF NOT EXISTS idx_session_logs_game_id"
+        " ON session_logs (game_id)"
+    ),
+    "idx_session_logs_date_game": (
+        "CREATE INDEX IF NOT EXISTS idx_session_logs_date_game"
+        " ON session_logs (session_date, game_id)"
+    ),
+    "idx_session_logs_game_sentiment": (
+        "CREATE INDEX IF NOT EXISTS idx_session_logs_game_sentiment"
+        " ON session_logs (game_id, sentiment, playtime_minutes)"
+    ),
+}
+
+
+def _schema_fingerprint() -> int:
+    """Stable fingerprint of the schema `_ensure_game_columns` guarantees.
+
+    Hashes names and definitions so editing a column type or an index's DDL
+    invalidates the stored version even without a rename. Stored in SQLite's
+    ``PRAGMA user_version`` (a signed 32-bit slot, hence the mask) so warm
+    boots can skip table reflection entirely.
+    """
+
+    payload = ",".join(
+        f"{name}:{definition}"
+        for name, definition in (
+            sorted(_GAME_COLUMN_DEFINITIONS.items())
+            + sorted(_INDEX_DEFINITIONS.items())
+        )
+    )
+    return crc32(payload.encode("utf-8")) & 0x7FFFFFFF
+
 
 def create_app(database_uri: str | None = None):
     app = Flask(__name__)
@@ -18,38 +70,86 @@ def create_app(database_uri: str | None = None):
     app.register_blueprint(core_bp)
 
     with app.app_context():
+        _configure_sqlite_pragmas()
         db.create_all()
         _ensure_game_columns()
+        _backfill_session_game_ids()
         normalize_existing_game_statuses()
 
     return app
 
 
+def _configure_sqlite_pragmas() -> None:
+    """Tune SQLite for concurrent reads and cheaper writes.
+
+    WAL lets the insight queries read while writes are in flight, NORMAL
+    synchronous drops the per-statement full fsync, and in-memory temp
+    storage keeps sort/aggregate spill off disk. Applied per pooled
+    connection via the connect event.
+    """
+
+    engine = db.engine
+    if engine.url.get_backend_name() != "sqlite":  # pragma: no cover
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def _backfill_session_game_ids() -> None:
+    """Link title-only session logs to their game rows.
+
+    Keeps the sentiment aggregation join on the indexed ``game_id`` path
+    instead of an OR over the foreign key and the title column.
+    """
+
+    try:
+        db.session.execute(
+            text(
+                "UPDATE session_logs"
+                " SET game_id = ("
+                "     SELECT id FROM games WHERE games.title = session_logs.game_title"
+                " )"
+                " WHERE game_id IS NULL"
+            )
+        )
+        db.session.commit()
+    except Exception:  # pragma: no cover - table may not exist yet
+        db.session.rollback()
+
+
 def _ensure_game_columns() -> None:
+    fingerprint = _schema_fingerprint()
+    try:
+        stored_version = db.session.execute(text("PRAGMA user_version")).scalar()
+    except Exception:  # pragma: no cover - non-SQLite backends
+        stored_version = None
+
+    if stored_version == fingerprint:
+        return
+
     inspector = inspect(db.engine)
     try:
         columns = {column["name"] for column in inspector.get_columns("games")}
     except Exception:  # pragma: no cover - fallback for first run
         return
 
-    column_definitions = {
-        "purchase_date": "DATE",
-        "start_date": "DATE",
-        "finish_date": "DATE",
-        "thoughts": "TEXT",
-        "price_amount": "REAL",
-        "price_currency": "VARCHAR(8)",
-        "purchase_price_amount": "REAL",
-        "purchase_price_currency": "VARCHAR(8)",
-    }
-
-    added = False
-    for column, column_type in column_definitions.items():
-        if column not in columns:
-            db.session.execute(
+    missing = [
+        (column, column_type)
+        for column, column_type in _GAME_COLUMN_DEFINITIONS.items()
+        if column not in columns
+    ]
+
+    with db.engine.begin() as connection:
+        for column, column_type in missing:
+            connection.execute(
                 text(f"ALTER TABLE games ADD COLUMN {column} {column_type}")
             )
-            added = True
-
-    if added:
-        db.session.commit()
+        for index_ddl in _INDEX_DEFINITIONS.values():
+            connection.execute(text(index_ddl))
+        connection.execute(text(f"PRAGMA user_version = {fingerprint}"))
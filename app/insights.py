@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import calendar
+import time
 from collections import defaultdict
+from json import loads
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from math import ceil, floor
-from statistics import fmean, median
-from types import SimpleNamespace
+from functools import lru_cache, wraps
+from heapq import nlargest
+from statistics import fmean, median, quantiles
 from typing import Any, Dict, Iterable, List
 
-from sqlalchemy import or_
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, g, has_request_context
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import load_only, selectinload
 
 from . import db
-from .metrics import compute_weighted_sentiment
+from .metrics import WeightedSentimentAccumulator, compute_weighted_sentiment
 from .models import Game, SessionLog
 from .statuses import (
     INSIGHT_BUCKET_BY_STATUS,
@@ -26,7 +32,7 @@ _DEFAULT_BUCKET_DISPLAY_ORDER = tuple(INSIGHT_BUCKET_DISPLAY_ORDER)
 if not _DEFAULT_BUCKET_DISPLAY_ORDER:
     _DEFAULT_BUCKET_DISPLAY_ORDER = tuple(INSIGHT_BUCKET_BY_STATUS.values())
 
-_INSIGHT_BUCKET_SET = set(INSIGHT_BUCKET_BY_STATUS.values())
+_INSIGHT_BUCKET_SET = frozenset(INSIGHT_BUCKET_BY_STATUS.values())
 _INSIGHT_BUCKETS = tuple(
     bucket for bucket in _DEFAULT_BUCKET_DISPLAY_ORDER if bucket in _INSIGHT_BUCKET_SET
 )
@@ -54,14 +60,53 @@ def _resolve_bucket_metadata(bucket: str) -> dict[str, str]:
     return payload
 
 
+# Resolved once at import and returned directly in payloads; never mutated.
 _BUCKET_METADATA = {
     bucket: _resolve_bucket_metadata(bucket) for bucket in _INSIGHT_BUCKETS
 }
 
+# Placeholder for (genre, bucket) pairs with no games; never mutated.
+_EMPTY_BUCKET_ENTRY: dict[str, Any] = {
+    "count": 0,
+    "weight": 0.0,
+    "share": 0.0,
+    "average_elo": None,
+}
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string without datetime allocation."""
+
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+@lru_cache(maxsize=4096)
+def _iso_date(value: date) -> str:
+    """ISO-format a date, cached since the same dates recur across rows."""
+
+    return value.isoformat()
 
-def _normalize_genres(genres: Iterable[str] | None) -> list[str]:
-    if not genres:
+
+def _genres_from_raw(raw: str | None) -> list[str]:
+    if not raw:
+        return []
+    try:
+        parsed = loads(raw)
+    except ValueError:
         return []
+    if not isinstance(parsed, list):
+        return []
+    # Array elements may be arbitrary JSON; stringify non-strings so the
+    # tuple-keyed caches downstream always receive hashable values.
+    return [
+        genre if isinstance(genre, str) else str(genre)
+        for genre in parsed
+        if genre
+    ]
+
+
+@lru_cache(maxsize=512)
+def _normalize_genre_tuple(genres: tuple) -> tuple[str, ...]:
     normalized = []
     for genre in genres:
         if not genre:
@@ -69,63 +114,254 @@ def _normalize_genres(genres: Iterable[str] | None) -> list[str]:
         label = str(genre).strip()
         if label:
             normalized.append(label)
-    return normalized
+    return tuple(normalized)
+
+
+@lru_cache(maxsize=512)
+def _normalized_genres_from_raw(raw: str | None) -> tuple[str, ...]:
+    """Parse and normalize a raw genres payload, cached per distinct string.
+
+    Joined session rows repeat each game's payload once per session, so the
+    JSON parse and per-element cleanup run once per distinct payload instead
+    of once per row.
+    """
+
+    return _normalize_genre_tuple(tuple(_genres_from_raw(raw)))
+
+
+def _request_cached(key: Any, compute):
+    """Memoize an insights payload for the lifetime of the current request.
+
+    Outside a request context (tests, shells) the value is recomputed every
+    time so callers never observe stale data.
+    """
+
+    if not has_request_context():
+        return compute()
+
+    cache = getattr(g, "_insights_cache", None)
+    if cache is None:
+        cache = {}
+        g._insights_cache = cache
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
+
+
+def _request_memoized(fn):
+    """Decorator form of :func:`_request_cached` for the summary builders.
+
+    A view that renders the same summary more than once per request (directly
+    and via a combined payload) only pays for the queries the first time.
+    Arguments are folded into the cache key so distinct invocations stay
+    distinct.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        return _request_cached(key, lambda: fn(*args, **kwargs))
 
+    return wrapper
 
+
+def _generated_at() -> str:
+    """Per-request generation timestamp shared by every summary payload.
+
+    Formatting the time once per request keeps the combined payloads'
+    timestamps consistent and avoids redundant strftime calls.
+    """
+
+    return _request_cached("generated_at", _utc_timestamp)
+
+
+# Every tracked status maps into an insight bucket, so the aggregation
+# queries filter to this list DB-side and rows for untracked or malformed
+# statuses never reach Python. Statuses are stored lowercase (normalized at
+# boot and on write), so the predicates compare the raw column and stay
+# servable by the status indexes. Status values are module constants, safe
+# to inline into the SQL text.
+_TRACKED_STATUS_SQL_LIST = ", ".join(
+    f"'{status}'" for status in sorted(INSIGHT_BUCKET_BY_STATUS)
+)
+
+# The fixed status→bucket mapping rendered as a SQL CASE, so grouping
+# happens on the bucket DB-side and Python never maps statuses per row.
+# Untracked statuses fall through to NULL.
+_STATUS_BUCKET_CASE_SQL = (
+    "CASE status "
+    + " ".join(
+        f"WHEN '{status}' THEN '{bucket}'"
+        for status, bucket in sorted(INSIGHT_BUCKET_BY_STATUS.items())
+    )
+    + " END"
+)
+
+_GENRE_PREFERENCE_SQL = f"""
+    SELECT
+        g.bucket AS bucket,
+        TRIM(genre.value) AS genre,
+        COUNT(*) AS game_count,
+        SUM(1.0 / g.n_genres) AS weight,
+        SUM(COALESCE(g.elo_rating, 0.0) / g.n_genres) AS elo_sum
+    FROM (
+        SELECT
+            gg.bucket,
+            gg.elo_rating,
+            gg.genres_json,
+            (
+                SELECT COUNT(*)
+                FROM json_each(gg.genres_json)
+                WHERE TRIM(COALESCE(value, '')) <> ''
+            ) AS n_genres
+        FROM (
+            SELECT
+                {_STATUS_BUCKET_CASE_SQL} AS bucket,
+                elo_rating,
+                CASE
+                    WHEN genres_raw IS NULL
+                        OR NOT json_valid(genres_raw)
+                        OR json_type(genres_raw) <> 'array' THEN '[]'
+                    ELSE genres_raw
+                END AS genres_json
+            FROM games
+            WHERE status IN ({_TRACKED_STATUS_SQL_LIST})
+        ) AS gg
+    ) AS g,
+    json_each(g.genres_json) AS genre
+    WHERE TRIM(COALESCE(genre.value, '')) <> '' AND g.n_genres > 0
+    GROUP BY g.bucket, TRIM(genre.value)
+"""
+
+_STATUS_GAME_COUNT_SQL = f"""
+    SELECT {_STATUS_BUCKET_CASE_SQL} AS bucket, COUNT(*) AS game_count
+    FROM games
+    WHERE status IN ({_TRACKED_STATUS_SQL_LIST})
+    GROUP BY bucket
+"""
+
+_GENRE_SENTIMENT_SQL = f"""
+    SELECT
+        TRIM(genre.value) AS genre,
+        g.bucket AS bucket,
+        LOWER(COALESCE(s.sentiment, '')) AS sentiment,
+        SUM(s.playtime_minutes * 1.0 / g.n_genres) AS minutes,
+        COUNT(*) AS session_count
+    FROM session_logs AS s
+    JOIN (
+        SELECT
+            gg.id,
+            gg.bucket,
+            gg.genres_json,
+            (
+                SELECT COUNT(*)
+                FROM json_each(gg.genres_json)
+                WHERE TRIM(COALESCE(value, '')) <> ''
+            ) AS n_genres
+        FROM (
+            SELECT
+                id,
+                {_STATUS_BUCKET_CASE_SQL} AS bucket,
+                CASE
+                    WHEN genres_raw IS NULL
+                        OR NOT json_valid(genres_raw)
+                        OR json_type(genres_raw) <> 'array' THEN '[]'
+                    ELSE genres_raw
+                END AS genres_json
+            FROM games
+        ) AS gg
+    ) AS g ON s.game_id = g.id,
+    json_each(g.genres_json) AS genre
+    WHERE TRIM(COALESCE(genre.value, '')) <> ''
+        AND g.n_genres > 0
+        AND s.playtime_minutes IS NOT NULL
+        AND s.playtime_minutes > 0
+    GROUP BY
+        TRIM(genre.value),
+        g.bucket,
+        LOWER(COALESCE(s.sentiment, ''))
+"""
+
+
+@_request_memoized
 def summarize_genre_preferences() -> Dict[str, Any]:
     """Aggregate genre preferences for every insights bucket.
 
     The aggregation distributes each game's weight evenly across its genres so
     multi-genre titles do not dominate the totals. For every genre we return the
     raw counts, weight share, and weighted average ELO for each status bucket as
-    well as a combined roll-up across all tracked lists.
+    well as a combined roll-up across all tracked lists. The per-game weighting
+    happens in SQL (``json_each`` over the genres column with a GROUP BY) so
+    only one row per (status, genre) pair is materialized in Python.
     """
 
-    def _metric_factory() -> dict[str, float]:
-        return {"count": 0, "weight": 0.0, "elo_sum": 0.0}
-
-    bucket_genre_totals: dict[str, dict[str, dict[str, float]]] = {
-        bucket: defaultdict(_metric_factory) for bucket in _INSIGHT_BUCKETS
+    # Per-(bucket, genre) packed totals: [count, weight, elo_sum].
+    bucket_genre_totals: dict[str, dict[str, list[float]]] = {
+        bucket: {} for bucket in _INSIGHT_BUCKETS
     }
     bucket_game_counts: dict[str, int] = {bucket: 0 for bucket in _INSIGHT_BUCKETS}
 
-    games: Iterable[Game] = Game.query.all()
-    for game in games:
-        status = (game.status or "").lower()
-        bucket = INSIGHT_BUCKET_BY_STATUS.get(status)
-        if bucket not in bucket_genre_totals:
-            continue
+    for row in db.session.execute(text(_STATUS_GAME_COUNT_SQL)):
+        if row.bucket in bucket_game_counts:
+            bucket_game_counts[row.bucket] += int(row.game_count)
 
-        bucket_game_counts[bucket] += 1
-        genres = _normalize_genres(game.genres)
-        if not genres:
+    for row in db.session.execute(text(_GENRE_PREFERENCE_SQL)):
+        totals = bucket_genre_totals.get(row.bucket)
+        if totals is None:
             continue
 
-        weight_per_genre = 1.0 / len(genres)
-        for genre in genres:
-            entry = bucket_genre_totals[bucket][genre]
-            entry["count"] += 1
-            entry["weight"] += weight_per_genre
-            entry["elo_sum"] += weight_per_genre * float(game.elo_rating or 0.0)
+        entry = totals.get(row.genre)
+        if entry is None:
+            totals[row.genre] = [
+                int(row.game_count),
+                float(row.weight or 0.0),
+                float(row.elo_sum or 0.0),
+            ]
+        else:
+            entry[0] += int(row.game_count)
+            entry[1] += float(row.weight or 0.0)
+            entry[2] += float(row.elo_sum or 0.0)
 
     status_summaries: dict[str, dict[str, Any]] = {}
+    combined_by_genre: dict[str, dict[str, Any]] = {}
+    combined_weight = 0.0
+
     for bucket, genre_totals in bucket_genre_totals.items():
-        total_weight = sum(metric["weight"] for metric in genre_totals.values())
-        total_count = sum(metric["count"] for metric in genre_totals.values())
+        total_weight = sum(metric[1] for metric in genre_totals.values())
+        total_count = sum(metric[0] for metric in genre_totals.values())
+        combined_weight += total_weight
         genres_summary = []
         for genre, metrics in genre_totals.items():
-            weight = metrics["weight"]
-            average_elo = metrics["elo_sum"] / weight if weight else None
+            count, weight, elo_sum = metrics
+            average_elo = elo_sum / weight if weight else None
             genres_summary.append(
                 {
                     "genre": genre,
-                    "count": metrics["count"],
+                    "count": count,
                     "weight": weight,
                     "share": (weight / total_weight) if total_weight else 0.0,
                     "average_elo": average_elo,
                 }
             )
 
+            combined = combined_by_genre.get(genre)
+            if combined is None:
+                combined = combined_by_genre[genre] = {
+                    "buckets": {},
+                    "count": 0,
+                    "weight": 0.0,
+                    "elo_sum": 0.0,
+                }
+            combined["buckets"][bucket] = {
+                "count": count,
+                "weight": weight,
+                "share": (weight / total_weight) if total_weight else 0.0,
+                "average_elo": average_elo,
+            }
+            combined["count"] += count
+            combined["weight"] += weight
+            combined["elo_sum"] += elo_sum
+
         genres_summary.sort(key=lambda item: (item["weight"], item["count"]), reverse=True)
         status_summaries[bucket] = {
             "total_games": bucket_game_counts.get(bucket, 0),
@@ -134,62 +370,37 @@ def summarize_genre_preferences() -> Dict[str, Any]:
             "genres": genres_summary,
         }
 
-    combined_weight = sum(summary["total_weight"] for summary in status_summaries.values())
     combined_genres = []
-    all_genres = set()
-    for totals in bucket_genre_totals.values():
-        all_genres.update(totals.keys())
-
-    def _format_entry(
-        bucket: str, genre: str, totals: dict[str, dict[str, float]]
-    ) -> dict[str, Any]:
-        metrics = totals.get(genre, {"count": 0, "weight": 0.0, "elo_sum": 0.0})
-        weight = metrics["weight"]
-        average_elo = metrics["elo_sum"] / weight if weight else None
-        status_total_weight = status_summaries.get(bucket, {}).get("total_weight", 0.0)
-        return {
-            "count": metrics["count"],
-            "weight": weight,
-            "share": (weight / status_total_weight) if status_total_weight else 0.0,
-            "average_elo": average_elo,
-            "elo_sum": metrics["elo_sum"],
-        }
-
-    for genre in sorted(all_genres):
+    for genre in sorted(combined_by_genre):
+        combined = combined_by_genre[genre]
+        per_bucket = combined["buckets"]
         bucket_entries: dict[str, dict[str, Any]] = {}
-        total_weight = 0.0
-        total_count = 0
-        total_elo_sum = 0.0
-
+        bucket_weights: dict[str, float] = {}
         for bucket in _INSIGHT_BUCKETS:
-            bucket_totals = bucket_genre_totals.get(bucket, defaultdict(_metric_factory))
-            entry_metrics = _format_entry(bucket, genre, bucket_totals)
-            bucket_entries[bucket] = entry_metrics
-            total_weight += entry_metrics["weight"]
-            total_count += entry_metrics["count"]
-            total_elo_sum += entry_metrics["elo_sum"]
-
-        total_average_elo = total_elo_sum / total_weight if total_weight else None
+            metrics = per_bucket.get(bucket)
+            if metrics is None:
+                # Empty pairs share one zero entry instead of allocating a
+                # fresh dict per (genre, bucket); the payload is read-only.
+                bucket_entries[bucket] = _EMPTY_BUCKET_ENTRY
+                bucket_weights[bucket] = 0.0
+            else:
+                bucket_entries[bucket] = metrics
+                bucket_weights[bucket] = metrics["weight"]
 
+        total_weight = combined["weight"]
+        total_average_elo = (
+            combined["elo_sum"] / total_weight if total_weight else None
+        )
         dominant_bucket, dominant_share = _determine_dominant_bucket(
-            {bucket: metrics["weight"] for bucket, metrics in bucket_entries.items()},
-            total_weight,
+            bucket_weights, total_weight
         )
 
         combined_genres.append(
             {
                 "genre": genre,
-                "buckets": {
-                    bucket: {
-                        "count": metrics["count"],
-                        "weight": metrics["weight"],
-                        "share": metrics["share"],
-                        "average_elo": metrics["average_elo"],
-                    }
-                    for bucket, metrics in bucket_entries.items()
-                },
+                "buckets": bucket_entries,
                 "total": {
-                    "count": total_count,
+                    "count": combined["count"],
                     "weight": total_weight,
                     "share": (total_weight / combined_weight) if combined_weight else 0.0,
                     "average_elo": total_average_elo,
@@ -203,10 +414,7 @@ def summarize_genre_preferences() -> Dict[str, Any]:
         key=lambda item: (item["total"]["weight"], item["total"]["count"]), reverse=True
     )
 
-    bucket_metadata = {
-        bucket: _BUCKET_METADATA.get(bucket, _resolve_bucket_metadata(bucket))
-        for bucket in _INSIGHT_BUCKETS
-    }
+    bucket_metadata = _BUCKET_METADATA
 
     for bucket, summary in status_summaries.items():
         metadata = bucket_metadata.get(bucket, {})
@@ -216,7 +424,7 @@ def summarize_genre_preferences() -> Dict[str, Any]:
             summary["color"] = metadata["color"]
 
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": _generated_at(),
         "bucket_order": list(_INSIGHT_BUCKETS),
         "bucket_metadata": bucket_metadata,
         "buckets": status_summaries,
@@ -231,97 +439,85 @@ def _determine_dominant_bucket(
     if total_weight <= tolerance:
         return "balanced", None
 
-    sorted_weights = sorted(
-        bucket_weights.items(), key=lambda item: item[1], reverse=True
-    )
-    top_bucket, top_weight = sorted_weights[0]
-    if top_weight <= tolerance:
+    # Track the top and runner-up weights in one pass; a sort is overkill
+    # when only the leader (and whether it is contested) matters.
+    top_bucket: str | None = None
+    top_weight = 0.0
+    second_weight = 0.0
+    for bucket, weight in bucket_weights.items():
+        if weight > top_weight or top_bucket is None:
+            second_weight = top_weight
+            top_bucket, top_weight = bucket, weight
+        elif weight > second_weight:
+            second_weight = weight
+
+    if top_bucket is None or top_weight <= tolerance:
         return "balanced", None
-
-    tied = [bucket for bucket, weight in sorted_weights if abs(weight - top_weight) <= tolerance]
-    if len(tied) > 1:
+    if top_weight - second_weight <= tolerance:
         return "balanced", None
 
-    share = top_weight / total_weight if total_weight else None
-    return top_bucket, share
+    return top_bucket, top_weight / total_weight
 
 
+@_request_memoized
 def summarize_genre_sentiment() -> Dict[str, Any]:
-    """Aggregate weighted sentiment scores per genre from play sessions."""
-
-    query = (
-        db.session.query(SessionLog, Game)
-        .outerjoin(
-            Game,
-            or_(
-                SessionLog.game_id == Game.id,
-                SessionLog.game_title == Game.title,
-            ),
-        )
-        .all()
-    )
-
-    genre_samples: dict[str, list[SimpleNamespace]] = defaultdict(list)
-    genre_status_samples: dict[str, dict[str, list[SimpleNamespace]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-    genre_playtime: dict[str, float] = defaultdict(float)
-    genre_status_playtime: dict[str, dict[str, float]] = defaultdict(
-        lambda: defaultdict(float)
-    )
-    genre_session_counts: dict[str, int] = defaultdict(int)
+    """Aggregate weighted sentiment scores per genre from play sessions.
 
-    for session, game in query:
-        if not game:
-            continue
-        genres = _normalize_genres(getattr(game, "genres", None))
-        if not genres:
-            continue
-
-        try:
-            minutes = float(session.playtime_minutes or 0)
-        except (TypeError, ValueError):
-            minutes = 0.0
-        if minutes <= 0:
-            continue
-
-        share = minutes / len(genres)
-        sentiment = str(session.sentiment or "").lower()
-        status = str(getattr(game, "status", "")).lower()
-        bucket = INSIGHT_BUCKET_BY_STATUS.get(status)
-
-        for genre in genres:
-            genre_samples[genre].append(
-                SimpleNamespace(sentiment=sentiment, playtime_minutes=share)
-            )
-            genre_playtime[genre] += share
-            genre_session_counts[genre] += 1
+    The per-session genre split happens in SQL (``json_each`` over the game's
+    genres with a GROUP BY on genre, bucket, and sentiment), so Python only
+    folds one pre-summed row per distinct combination into the accumulators
+    instead of walking every session.
+    """
 
-            if bucket in _INSIGHT_BUCKETS:
-                genre_status_samples[genre][bucket].append(
-                    SimpleNamespace(sentiment=sentiment, playtime_minutes=share)
+    # Per-bucket maps are keyed by (genre, bucket) tuples rather than nested
+    # dicts: one hash probe per update and no inner dict allocation when a
+    # genre first appears.
+    genre_totals: dict[str, WeightedSentimentAccumulator] = {}
+    genre_status_totals: dict[tuple[str, str], WeightedSentimentAccumulator] = {}
+    genre_session_counts: dict[str, int] = defaultdict(int)
+    genre_status_counts: dict[tuple[str, str], int] = defaultdict(int)
+
+    for row in db.session.execute(text(_GENRE_SENTIMENT_SQL)):
+        genre = row.genre
+        minutes = float(row.minutes or 0.0)
+        session_count = int(row.session_count)
+
+        totals = genre_totals.get(genre)
+        if totals is None:
+            totals = genre_totals[genre] = WeightedSentimentAccumulator()
+        totals.add(row.sentiment, minutes)
+        genre_session_counts[genre] += session_count
+
+        bucket = row.bucket
+        if bucket in _INSIGHT_BUCKET_SET:
+            key = (genre, bucket)
+            status_totals = genre_status_totals.get(key)
+            if status_totals is None:
+                status_totals = genre_status_totals[key] = (
+                    WeightedSentimentAccumulator()
                 )
-                genre_status_playtime[genre][bucket] += share
+            status_totals.add(row.sentiment, minutes)
+            genre_status_counts[key] += session_count
+
+    status_summaries: dict[str, dict[str, Any]] = defaultdict(dict)
+    for (genre, bucket), status_totals in genre_status_totals.items():
+        status_result = status_totals.result()
+        status_summaries[genre][bucket] = {
+            "weighted_sentiment": status_result.weighted_score,
+            "total_playtime_minutes": status_result.total_minutes,
+            "session_count": genre_status_counts[(genre, bucket)],
+        }
 
     genres_summary = []
-    for genre, samples in genre_samples.items():
-        result = compute_weighted_sentiment(samples)
-        status_summary: dict[str, Any] = {}
-        for status, status_samples in genre_status_samples.get(genre, {}).items():
-            status_result = compute_weighted_sentiment(status_samples)
-            status_summary[status] = {
-                "weighted_sentiment": status_result.weighted_score,
-                "total_playtime_minutes": genre_status_playtime[genre][status],
-                "session_count": len(status_samples),
-            }
-
+    for genre, totals in genre_totals.items():
+        result = totals.result()
         genres_summary.append(
             {
                 "genre": genre,
                 "weighted_sentiment": result.weighted_score,
-                "total_playtime_minutes": genre_playtime[genre],
+                "total_playtime_minutes": result.total_minutes,
                 "session_count": genre_session_counts[genre],
-                "statuses": status_summary,
+                "statuses": status_summaries.get(genre, {}),
             }
         )
 
@@ -331,21 +527,43 @@ def summarize_genre_sentiment() -> Dict[str, Any]:
     )
 
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": _generated_at(),
         "genres": genres_summary,
         "bucket_order": list(_INSIGHT_BUCKETS),
-        "bucket_metadata": {
-            bucket: _BUCKET_METADATA.get(bucket, _resolve_bucket_metadata(bucket))
-            for bucket in _INSIGHT_BUCKETS
-        },
+        "bucket_metadata": _BUCKET_METADATA,
     }
 
 
+def _compute_genre_summaries() -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run the preference and sentiment summaries on parallel workers.
+
+    The two summaries are independent read-only queries, so each worker
+    pushes its own app context (and therefore gets its own session and
+    connection) and they execute concurrently.
+    """
+
+    app = current_app._get_current_object()
+
+    def _with_app_context(compute):
+        with app.app_context():
+            return compute()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        preference_future = executor.submit(
+            _with_app_context, summarize_genre_preferences
+        )
+        sentiment_future = executor.submit(
+            _with_app_context, summarize_genre_sentiment
+        )
+        return preference_future.result(), sentiment_future.result()
+
+
 def build_genre_interest_sentiment() -> Dict[str, Any]:
     """Combine ELO interest with weighted sentiment enjoyment by genre."""
 
-    preference_summary = summarize_genre_preferences()
-    sentiment_summary = summarize_genre_sentiment()
+    preference_summary, sentiment_summary = _request_cached(
+        "genre_summaries", _compute_genre_summaries
+    )
     preference_lookup = {
         entry["genre"]: entry for entry in preference_summary.get("genres", [])
     }
@@ -390,36 +608,70 @@ def build_genre_interest_sentiment() -> Dict[str, Any]:
         "generated_at": sentiment_summary.get("generated_at"),
         "genres": genres_payload,
         "bucket_order": list(_INSIGHT_BUCKETS),
-        "bucket_metadata": {
-            bucket: preference_buckets.get(bucket, _BUCKET_METADATA.get(bucket, {}))
-            for bucket in _INSIGHT_BUCKETS
-        },
+        "bucket_metadata": preference_buckets or _BUCKET_METADATA,
     }
 
 
+# Positional slots for the per-currency running totals in
+# summarize_price_insights; two list-index updates per game beat the
+# nested dict lookups, and the packed lists are zipped back into keyed
+# dicts once at readout.
+_CURRENCY_FIELDS = (
+    "owned_amount",
+    "owned_count",
+    "backlog_amount",
+    "backlog_count",
+    "wishlist_amount",
+    "wishlist_count",
+    "tracked_hours",
+    "tracked_titles",
+)
+(
+    _OWNED_AMOUNT,
+    _OWNED_COUNT,
+    _BACKLOG_AMOUNT,
+    _BACKLOG_COUNT,
+    _WISHLIST_AMOUNT,
+    _WISHLIST_COUNT,
+    _TRACKED_HOURS,
+    _TRACKED_TITLES,
+) = range(len(_CURRENCY_FIELDS))
+
+
+def _coerce_amount(value: Any) -> float | None:
+    """Best-effort conversion of a stored price to a non-negative float.
+
+    SQLite hands REAL columns back as floats already, so the common case
+    returns without entering the guarded conversion.
+    """
+
+    if type(value) is float:
+        return value if value >= 0 else None
+    if value is None:
+        return None
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        return None
+    return amount if amount >= 0 else None
+
+
+@_request_memoized
 def summarize_price_insights(
     *, today: date | None = None, top_limit: int = 5
 ) -> Dict[str, Any]:
     """Generate pricing-focused insights across backlog and wishlist games."""
 
     today = today or date.today()
+    # Ordinal subtraction avoids allocating a timedelta per backlog game.
+    today_ordinal = today.toordinal()
 
-    def _init_currency_record() -> dict[str, Any]:
-        return {
-            "owned_amount": 0.0,
-            "owned_count": 0,
-            "backlog_amount": 0.0,
-            "backlog_count": 0,
-            "wishlist_amount": 0.0,
-            "wishlist_count": 0,
-            "tracked_hours": 0.0,
-            "tracked_titles": 0,
-        }
-
-    currency_totals: dict[str, dict[str, Any]] = defaultdict(_init_currency_record)
+    currency_totals: dict[str, list] = defaultdict(
+        lambda: [0.0, 0, 0.0, 0, 0.0, 0, 0.0, 0]
+    )
     backlog_candidates: list[dict[str, Any]] = []
     wishlist_candidates: list[dict[str, Any]] = []
-    priced_games: list[dict[str, Any]] = []
+    value_map: dict[str, list[dict[str, Any]]] = defaultdict(list)
     savings_totals: dict[str, dict[str, float]] = defaultdict(
         lambda: {
             "total_saved": 0.0,
@@ -430,39 +682,46 @@ def summarize_price_insights(
     )
     savings_entries: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
-    games: Iterable[Game] = Game.query.all()
+    # Stream in batches instead of materializing the whole library up front;
+    # selectin loading fetches each batch's sessions as it arrives, so peak
+    # memory stays at one batch of games rather than the full result set.
+    games: Iterable[Game] = Game.query.options(
+        load_only(
+            Game.id,
+            Game.title,
+            Game.status,
+            Game.elo_rating,
+            Game.price_amount,
+            Game.price_currency,
+            Game.purchase_price_amount,
+            Game.purchase_price_currency,
+            Game.purchase_date,
+            Game.created_at,
+        ),
+        selectinload(Game.sessions),
+    ).yield_per(200)
+
+    # Statuses repeat across the library; lowercase each distinct raw value
+    # only once rather than per game.
+    status_cache: dict[str, str] = {}
+
     for game in games:
-        status = (game.status or "").lower()
+        raw_status = game.status or ""
+        status = status_cache.get(raw_status)
+        if status is None:
+            status = status_cache[raw_status] = raw_status.lower()
 
-        list_amount: float | None = None
+        list_amount = _coerce_amount(game.price_amount)
         list_currency: str | None = None
-        if game.price_amount is not None:
-            try:
-                list_amount = float(game.price_amount)
-            except (TypeError, ValueError):
-                list_amount = None
-            else:
-                if list_amount < 0:
-                    list_amount = None
-                else:
-                    list_currency = (game.price_currency or "MYR").upper()
+        if list_amount is not None:
+            list_currency = (game.price_currency or "MYR").upper()
 
-        purchase_amount: float | None = None
+        purchase_amount = _coerce_amount(game.purchase_price_amount)
         purchase_currency: str | None = None
-        if game.purchase_price_amount is not None:
-            try:
-                purchase_amount = float(game.purchase_price_amount)
-            except (TypeError, ValueError):
-                purchase_amount = None
-            else:
-                if purchase_amount < 0:
-                    purchase_amount = None
-                else:
-                    purchase_currency = (
-                        game.purchase_price_currency or list_currency or "MYR"
-                    )
-                    if purchase_currency:
-                        purchase_currency = purchase_currency.upper()
+        if purchase_amount is not None:
+            purchase_currency = (
+                game.purchase_price_currency or list_currency or "MYR"
+            ).upper()
 
         effective_amount = (
             purchase_amount if purchase_amount is not None else list_amount
@@ -478,29 +737,29 @@ def summarize_price_insights(
 
         record = currency_totals[currency]
         if status in OWNED_STATUSES:
-            record["owned_amount"] += effective_amount
-            record["owned_count"] += 1
+            record[_OWNED_AMOUNT] += effective_amount
+            record[_OWNED_COUNT] += 1
 
         if status == "backlog":
-            record["backlog_amount"] += effective_amount
-            record["backlog_count"] += 1
+            record[_BACKLOG_AMOUNT] += effective_amount
+            record[_BACKLOG_COUNT] += 1
             backlog_candidates.append(
                 {
                     "id": game.id,
                     "title": game.title,
                     "price": {"amount": effective_amount, "currency": currency},
-                    "purchase_date": game.purchase_date.isoformat()
+                    "purchase_date": _iso_date(game.purchase_date)
                     if game.purchase_date
                     else None,
-                    "days_owned": (today - game.purchase_date).days
+                    "days_owned": today_ordinal - game.purchase_date.toordinal()
                     if isinstance(game.purchase_date, date)
                     else None,
                     "elo_rating": float(game.elo_rating or 0.0),
                 }
             )
         elif status == "wishlist":
-            record["wishlist_amount"] += effective_amount
-            record["wishlist_count"] += 1
+            record[_WISHLIST_AMOUNT] += effective_amount
+            record[_WISHLIST_COUNT] += 1
             wishlist_candidates.append(
                 {
                     "id": game.id,
@@ -541,53 +800,26 @@ def summarize_price_insights(
                     },
                     "saved_amount": saved_amount,
                     "saved_percent": percent,
-                    "purchase_date": game.purchase_date.isoformat()
+                    "purchase_date": _iso_date(game.purchase_date)
                     if isinstance(game.purchase_date, date)
                     else None,
                 }
             )
 
-        priced_games.append(
-            {
-                "game": game,
-                "currency": currency,
-                "amount": effective_amount,
-                "status": status,
-                "list_price": (
-                    {"amount": list_amount, "currency": list_currency}
-                    if list_amount is not None and list_currency
-                    else None
-                ),
-                "purchase_price": (
-                    {"amount": purchase_amount, "currency": purchase_currency}
-                    if purchase_amount is not None and purchase_currency
-                    else None
-                ),
-            }
+        # The value metrics are derived in the same pass instead of staging
+        # every priced game in an intermediate buffer and re-walking it.
+        amount = effective_amount
+        list_price = (
+            {"amount": list_amount, "currency": list_currency}
+            if list_amount is not None and list_currency
+            else None
         )
-
-    priced_game_ids = [
-        entry["game"].id for entry in priced_games if entry.get("game") and entry["game"].id
-    ]
-    sessions_by_game: dict[int, list[SessionLog]] = defaultdict(list)
-    if priced_game_ids:
-        session_rows: Iterable[SessionLog] = SessionLog.query.filter(
-            SessionLog.game_id.in_(priced_game_ids)
-        ).all()
-        for session in session_rows:
-            if session.game_id:
-                sessions_by_game[int(session.game_id)].append(session)
-
-    value_map: dict[str, list[dict[str, Any]]] = defaultdict(list)
-
-    for entry in priced_games:
-        game = entry["game"]
-        currency = entry["currency"]
-        amount = entry["amount"]
-        status = entry["status"]
-        list_price = entry.get("list_price")
-        purchase_price = entry.get("purchase_price")
-        sessions = sessions_by_game.get(game.id or -1, [])
+        purchase_price = (
+            {"amount": purchase_amount, "currency": purchase_currency}
+            if purchase_amount is not None and purchase_currency
+            else None
+        )
+        sessions = game.sessions
         total_minutes = 0.0
         for session in sessions:
             try:
@@ -633,29 +865,32 @@ def summarize_price_insights(
                     value_entry["enjoyment_per_cost"] = hours_per_currency
 
             record = currency_totals[currency]
-            record["tracked_hours"] += total_hours
-            record["tracked_titles"] += 1
+            record[_TRACKED_HOURS] += total_hours
+            record[_TRACKED_TITLES] += 1
 
         value_map[currency].append(value_entry)
 
-    for currency, record in currency_totals.items():
-        owned_count = record.get("owned_count", 0) or 0
-        backlog_count = record.get("backlog_count", 0) or 0
-        wishlist_count = record.get("wishlist_count", 0) or 0
+    finalized_totals: dict[str, dict[str, Any]] = {}
+    for currency, packed in currency_totals.items():
+        record: dict[str, Any] = dict(zip(_CURRENCY_FIELDS, packed))
+        owned_count = packed[_OWNED_COUNT]
+        backlog_count = packed[_BACKLOG_COUNT]
+        wishlist_count = packed[_WISHLIST_COUNT]
+        tracked_titles = packed[_TRACKED_TITLES]
 
         record["average_owned_price"] = (
-            record["owned_amount"] / owned_count if owned_count else None
+            packed[_OWNED_AMOUNT] / owned_count if owned_count else None
         )
         record["average_backlog_price"] = (
-            record["backlog_amount"] / backlog_count if backlog_count else None
+            packed[_BACKLOG_AMOUNT] / backlog_count if backlog_count else None
         )
         record["average_wishlist_price"] = (
-            record["wishlist_amount"] / wishlist_count if wishlist_count else None
+            packed[_WISHLIST_AMOUNT] / wishlist_count if wishlist_count else None
         )
-        tracked_titles = record.get("tracked_titles", 0) or 0
         record["average_tracked_hours"] = (
-            record["tracked_hours"] / tracked_titles if tracked_titles else None
+            packed[_TRACKED_HOURS] / tracked_titles if tracked_titles else None
         )
+        finalized_totals[currency] = record
 
     def _best_sort_key(entry: dict[str, Any]) -> tuple[float, float]:
         enjoyment = entry.get("enjoyment_per_cost")
@@ -671,6 +906,8 @@ def summarize_price_insights(
             return (-float("inf"), -float(total_hours))
         return (float(cost_per_hour), -float(total_hours))
 
+    limit = max(0, int(top_limit))
+
     value_summary: dict[str, dict[str, list[dict[str, Any]]]] = {}
     for currency, entries in value_map.items():
         best_candidates = [
@@ -686,31 +923,37 @@ def summarize_price_insights(
             and entry.get("status") in OWNED_STATUSES
         ]
 
-        best_entries = sorted(
-            best_candidates, key=_best_sort_key, reverse=True
-        )[: max(0, int(top_limit))]
-        underutilized_entries = sorted(
-            underutilized_candidates, key=_worst_sort_key, reverse=True
-        )[: max(0, int(top_limit))]
+        best_entries = nlargest(limit, best_candidates, key=_best_sort_key)
+        underutilized_entries = nlargest(
+            limit, underutilized_candidates, key=_worst_sort_key
+        )
 
         value_summary[currency] = {
             "best": best_entries,
             "underutilized": underutilized_entries,
         }
 
-    backlog_candidates.sort(
+    # Only the top slices ship in the payload, so select them with a bounded
+    # heap instead of fully sorting each candidate list.
+    expensive_backlog = nlargest(
+        limit,
+        backlog_candidates,
         key=lambda item: (item["price"]["amount"], item.get("days_owned") or -1),
-        reverse=True,
     )
-    wishlist_candidates.sort(
+    expensive_wishlist = nlargest(
+        limit,
+        wishlist_candidates,
         key=lambda item: (item["price"]["amount"], item.get("elo_rating", 0.0)),
-        reverse=True,
     )
-
-    wishlist_interest = sorted(
-        wishlist_candidates,
+    # Unrated (zero ELO) wishlist games can never outrank a rated one, so
+    # drop them before the heap unless too few rated candidates remain.
+    interest_candidates = [item for item in wishlist_candidates if item["elo_rating"]]
+    if len(interest_candidates) < limit:
+        interest_candidates = wishlist_candidates
+    wishlist_interest = nlargest(
+        limit,
+        interest_candidates,
         key=lambda item: item.get("elo_rating", 0.0),
-        reverse=True,
     )
 
     resolved_totals = {
@@ -718,7 +961,7 @@ def summarize_price_insights(
             key: (round(value, 2) if isinstance(value, float) else value)
             for key, value in record.items()
         }
-        for currency, record in currency_totals.items()
+        for currency, record in finalized_totals.items()
     }
 
     savings_summary: dict[str, dict[str, Any]] = {}
@@ -734,17 +977,16 @@ def summarize_price_insights(
             percent_total / percent_count if percent_count else None
         )
 
-        entries = savings_entries.get(currency, [])
-        entries.sort(
+        top_entries = nlargest(
+            limit,
+            savings_entries.get(currency, []),
             key=lambda item: (
                 float(item.get("saved_amount", 0.0) or 0.0),
                 float(item.get("saved_percent") or 0.0),
             ),
-            reverse=True,
         )
-        limit = max(0, int(top_limit))
         formatted_entries: list[dict[str, Any]] = []
-        for entry in entries[:limit]:
+        for entry in top_entries:
             formatted: dict[str, Any] = {
                 "id": entry.get("id"),
                 "title": entry.get("title"),
@@ -791,18 +1033,18 @@ def summarize_price_insights(
         )[0]
 
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": _generated_at(),
         "currency_totals": resolved_totals,
         "primary_currency": primary_currency,
         "backlog": {
-            "most_expensive": backlog_candidates[: max(0, int(top_limit))],
+            "most_expensive": expensive_backlog,
             "total_priced": sum(
                 record.get("backlog_count", 0) for record in resolved_totals.values()
             ),
         },
         "wishlist": {
-            "most_expensive": wishlist_candidates[: max(0, int(top_limit))],
-            "highest_interest": wishlist_interest[: max(0, int(top_limit))],
+            "most_expensive": expensive_wishlist,
+            "highest_interest": wishlist_interest,
             "total_priced": sum(
                 record.get("wishlist_count", 0) for record in resolved_totals.values()
             ),
@@ -812,25 +1054,6 @@ def summarize_price_insights(
     }
 
 
-def _percentile(sorted_values: list[float], percentile: float) -> float | None:
-    if not sorted_values:
-        return None
-    if percentile <= 0:
-        return float(sorted_values[0])
-    if percentile >= 1:
-        return float(sorted_values[-1])
-
-    index = (len(sorted_values) - 1) * percentile
-    lower = floor(index)
-    upper = ceil(index)
-    lower_value = float(sorted_values[lower])
-    upper_value = float(sorted_values[upper])
-    if lower == upper:
-        return lower_value
-    fraction = index - lower
-    return lower_value + (upper_value - lower_value) * fraction
-
-
 def _describe_durations(values: list[int]) -> dict[str, Any]:
     if not values:
         return {
@@ -843,134 +1066,174 @@ def _describe_durations(values: list[int]) -> dict[str, Any]:
         }
 
     sorted_values = sorted(values)
+    if len(sorted_values) == 1:
+        only_value = float(sorted_values[0])
+        percentile_values = {
+            "p10": only_value,
+            "p25": only_value,
+            "p75": only_value,
+            "p90": only_value,
+        }
+    else:
+        # One interpolation pass; "inclusive" matches the linear method the
+        # previous hand-rolled percentile helper used.
+        cuts = quantiles(sorted_values, n=20, method="inclusive")
+        percentile_values = {
+            "p10": float(cuts[1]),
+            "p25": float(cuts[4]),
+            "p75": float(cuts[14]),
+            "p90": float(cuts[17]),
+        }
+
     return {
         "count": len(sorted_values),
         "min": float(sorted_values[0]),
         "max": float(sorted_values[-1]),
         "mean": float(fmean(sorted_values)),
         "median": float(median(sorted_values)),
-        "percentiles": {
-            "p10": _percentile(sorted_values, 0.10),
-            "p25": _percentile(sorted_values, 0.25),
-            "p75": _percentile(sorted_values, 0.75),
-            "p90": _percentile(sorted_values, 0.90),
-        },
+        "percentiles": percentile_values,
     }
 
 
-def summarize_lifecycle_metrics(*, today: date | None = None, backlog_limit: int = 8) -> Dict[str, Any]:
-    """Generate lifecycle timing metrics for backlog management decisions."""
+_AGING_BACKLOG_SQL = """
+    SELECT
+        id,
+        title,
+        purchase_date,
+        COALESCE(purchase_date, DATE(created_at)) AS added_date,
+        MAX(
+            0,
+            CAST(
+                JULIANDAY(:today)
+                - JULIANDAY(COALESCE(purchase_date, DATE(created_at)))
+                AS INTEGER
+            )
+        ) AS days_waiting
+    FROM games
+    WHERE status = 'backlog'
+        AND start_date IS NULL
+        AND COALESCE(purchase_date, created_at) IS NOT NULL
+"""
 
-    reference_date = today or date.today()
-    purchase_to_start_samples: list[dict[str, Any]] = []
-    start_to_finish_samples: list[dict[str, Any]] = []
-    purchase_to_finish_samples: list[dict[str, Any]] = []
-    backlog_waiting: list[dict[str, Any]] = []
 
-    games: Iterable[Game] = Game.query.all()
-    for game in games:
-        purchase_date = getattr(game, "purchase_date", None)
-        start_date = getattr(game, "start_date", None)
-        finish_date = getattr(game, "finish_date", None)
+def _lifecycle_interval_summary(start_column: str, end_column: str) -> dict[str, Any]:
+    """Summarize one lifecycle interval from SQL-computed day deltas.
 
-        if purchase_date and start_date:
-            delta = (start_date - purchase_date).days
-            purchase_to_start_samples.append(
-                {
-                    "game_id": game.id,
-                    "title": game.title,
-                    "days": int(delta),
-                    "purchase_date": purchase_date.isoformat(),
-                    "start_date": start_date.isoformat(),
-                }
-            )
+    Rows stay as lightweight column tuples; result dicts are built only for
+    the five longest examples that actually ship in the payload.
+    """
 
-        if start_date and finish_date:
-            delta = (finish_date - start_date).days
-            start_to_finish_samples.append(
-                {
-                    "game_id": game.id,
-                    "title": game.title,
-                    "days": int(delta),
-                    "start_date": start_date.isoformat(),
-                    "finish_date": finish_date.isoformat(),
-                }
-            )
+    sql = f"""
+        SELECT
+            id,
+            title,
+            {start_column},
+            {end_column},
+            CAST(
+                JULIANDAY({end_column}) - JULIANDAY({start_column}) AS INTEGER
+            ) AS days
+        FROM games
+        WHERE {start_column} IS NOT NULL AND {end_column} IS NOT NULL
+    """
+    rows = db.session.execute(text(sql)).all()
+    durations = [int(row.days) for row in rows]
+    longest_examples = [
+        {
+            "game_id": row.id,
+            "title": row.title,
+            "days": int(row.days),
+            start_column: getattr(row, start_column),
+            end_column: getattr(row, end_column),
+        }
+        for row in nlargest(5, rows, key=lambda row: row.days)
+    ]
+    return {
+        "statistics": _describe_durations(durations),
+        "longest_examples": longest_examples,
+    }
 
-        if purchase_date and finish_date:
-            delta = (finish_date - purchase_date).days
-            purchase_to_finish_samples.append(
-                {
-                    "game_id": game.id,
-                    "title": game.title,
-                    "days": int(delta),
-                    "purchase_date": purchase_date.isoformat(),
-                    "finish_date": finish_date.isoformat(),
-                }
-            )
 
-        status = (game.status or "").lower()
-        if status == "backlog" and not start_date:
-            anchor_date = purchase_date
-            if not anchor_date and getattr(game, "created_at", None):
-                anchor_date = game.created_at.date()
-
-            if anchor_date:
-                wait_days = max(0, (reference_date - anchor_date).days)
-                backlog_waiting.append(
-                    {
-                        "game_id": game.id,
-                        "title": game.title,
-                        "days_waiting": int(wait_days),
-                        "purchase_date": purchase_date.isoformat()
-                        if purchase_date
-                        else None,
-                        "added_date": anchor_date.isoformat(),
-                    }
-                )
+def summarize_lifecycle_metrics(*, today: date | None = None, backlog_limit: int = 8) -> Dict[str, Any]:
+    """Generate lifecycle timing metrics for backlog management decisions.
 
-    def _summarize(samples: list[dict[str, Any]]) -> dict[str, Any]:
-        durations = [sample["days"] for sample in samples]
-        statistics = _describe_durations(durations)
-        longest_examples = sorted(samples, key=lambda entry: entry["days"], reverse=True)[:5]
-        return {
-            "statistics": statistics,
-            "longest_examples": longest_examples,
-        }
+    Date deltas are computed in SQLite via JULIANDAY so only games with the
+    relevant date pairs ever reach Python.
+    """
 
-    backlog_waiting.sort(key=lambda entry: entry["days_waiting"], reverse=True)
+    reference_date = today or date.today()
+
+    backlog_rows = db.session.execute(
+        text(_AGING_BACKLOG_SQL), {"today": reference_date.isoformat()}
+    ).all()
+    aging_backlog = [
+        {
+            "game_id": row.id,
+            "title": row.title,
+            "days_waiting": int(row.days_waiting),
+            "purchase_date": row.purchase_date,
+            "added_date": row.added_date,
+        }
+        for row in nlargest(
+            max(0, int(backlog_limit)), backlog_rows, key=lambda row: row.days_waiting
+        )
+    ]
 
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "purchase_to_start": _summarize(purchase_to_start_samples),
-        "start_to_finish": _summarize(start_to_finish_samples),
-        "purchase_to_finish": _summarize(purchase_to_finish_samples),
-        "aging_backlog": backlog_waiting[: max(0, int(backlog_limit))],
+        "generated_at": _generated_at(),
+        "purchase_to_start": _lifecycle_interval_summary(
+            "purchase_date", "start_date"
+        ),
+        "start_to_finish": _lifecycle_interval_summary("start_date", "finish_date"),
+        "purchase_to_finish": _lifecycle_interval_summary(
+            "purchase_date", "finish_date"
+        ),
+        "aging_backlog": aging_backlog,
     }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PeriodWindow:
     start: date
     end: date
 
 
+def _month_window(session_date: date) -> _PeriodWindow:
+    start = session_date.replace(day=1)
+    last_day = calendar.monthrange(session_date.year, session_date.month)[1]
+    end = session_date.replace(day=last_day)
+    return _PeriodWindow(start=start, end=end)
+
+
+def _week_window(session_date: date) -> _PeriodWindow:
+    iso_year, iso_week, _ = session_date.isocalendar()
+    start = date.fromisocalendar(iso_year, iso_week, 1)
+    end = start + timedelta(days=6)
+    return _PeriodWindow(start=start, end=end)
+
+
+def _day_window(session_date: date) -> _PeriodWindow:
+    return _PeriodWindow(start=session_date, end=session_date)
+
+
+_PERIOD_WINDOW_RESOLVERS = {
+    "month": _month_window,
+    "week": _week_window,
+    "day": _day_window,
+}
+
+
+@lru_cache(maxsize=4096)
 def _resolve_period_window(session_date: date, period: str) -> _PeriodWindow:
-    if period == "month":
-        start = session_date.replace(day=1)
-        last_day = calendar.monthrange(session_date.year, session_date.month)[1]
-        end = session_date.replace(day=last_day)
-        return _PeriodWindow(start=start, end=end)
-    if period == "week":
-        iso_year, iso_week, _ = session_date.isocalendar()
-        start = date.fromisocalendar(iso_year, iso_week, 1)
-        end = start + timedelta(days=6)
-        return _PeriodWindow(start=start, end=end)
-    if period == "day":
-        return _PeriodWindow(start=session_date, end=session_date)
-    raise ValueError(f"Unsupported period: {period}")
+    # Sessions cluster on a handful of distinct dates per window, so the
+    # monthrange/isocalendar arithmetic is cached per (date, period); the
+    # period branch is a dict dispatch rather than chained comparisons.
+    resolver = _PERIOD_WINDOW_RESOLVERS.get(period)
+    if resolver is None:
+        raise ValueError(f"Unsupported period: {period}")
+    return resolver(session_date)
 
 
+@lru_cache(maxsize=512)
 def _format_period_label(window: _PeriodWindow, period: str) -> str:
     if period == "month":
         return window.start.strftime("%b %Y")
@@ -982,46 +1245,30 @@ def _format_period_label(window: _PeriodWindow, period: str) -> str:
     return window.start.isoformat()
 
 
-def _collect_game_lookup(
-    game_ids: Iterable[int | None],
-    game_titles: Iterable[str | None],
-) -> tuple[dict[int, Game], dict[str, Game]]:
-    ids = {identifier for identifier in game_ids if identifier}
-    titles = {str(title).strip() for title in game_titles if title}
-
-    filters = []
-    if ids:
-        filters.append(Game.id.in_(ids))
-    if titles:
-        filters.append(Game.title.in_(titles))
-
-    if not filters:
-        return {}, {}
-
-    if len(filters) == 1:
-        games = Game.query.filter(filters[0]).all()
-    else:
-        games = Game.query.filter(or_(*filters)).all()
-
-    by_id = {game.id: game for game in games if game.id is not None}
-    by_title = {game.title.lower(): game for game in games if game.title}
-    return by_id, by_title
-
-
-def _resolve_game_for_session(
-    session: SessionLog,
-    *,
-    games_by_id: dict[int, Game],
-    games_by_title: dict[str, Game],
-) -> Game | None:
-    if session.game_id and session.game_id in games_by_id:
-        return games_by_id[session.game_id]
-
-    title = (session.game_title or "").strip().lower()
-    if title and title in games_by_title:
-        return games_by_title[title]
-
-    return None
+# Built once at import so repeated endpoint hits reuse the same statement
+# (and its compiled-SQL cache entry); per-call date bounds are appended as
+# extra WHERE clauses. Sessions join games on the indexed primary key
+# (title-only logs are resolved at boot and on creation), only the columns
+# the aggregation needs are selected, and null dates / non-positive playtime
+# are filtered in SQL so the Python loop needs no guarded conversions.
+_ENGAGEMENT_TREND_STMT = (
+    select(
+        SessionLog.session_date,
+        SessionLog.playtime_minutes,
+        func.lower(SessionLog.sentiment).label("sentiment"),
+        SessionLog.game_id,
+        SessionLog.game_title,
+        Game.title.label("resolved_title"),
+        Game.genres_raw,
+    )
+    .outerjoin(Game, SessionLog.game_id == Game.id)
+    .where(
+        SessionLog.session_date.isnot(None),
+        SessionLog.playtime_minutes.isnot(None),
+        SessionLog.playtime_minutes > 0,
+    )
+    .order_by(SessionLog.session_date.asc())
+)
 
 
 def summarize_engagement_trend(
@@ -1034,107 +1281,93 @@ def summarize_engagement_trend(
     if period not in {"month", "week", "day"}:
         raise ValueError("Period must be 'month', 'week', or 'day'")
 
-    query = SessionLog.query
+    stmt = _ENGAGEMENT_TREND_STMT
     if start_date:
-        query = query.filter(SessionLog.session_date >= start_date)
+        stmt = stmt.where(SessionLog.session_date >= start_date)
     if end_date:
-        query = query.filter(SessionLog.session_date <= end_date)
+        stmt = stmt.where(SessionLog.session_date <= end_date)
 
-    sessions: List[SessionLog] = query.order_by(SessionLog.session_date.asc()).all()
-    games_by_id, games_by_title = _collect_game_lookup(
-        (session.game_id for session in sessions),
-        (session.game_title for session in sessions),
-    )
+    # Stream in batches rather than materializing the whole history at once.
+    rows = db.session.execute(stmt.execution_options(yield_per=1000))
 
     timeline_map: dict[date, dict[str, Any]] = {}
+    range_start: date | None = None
+    range_end: date | None = None
 
-    for session in sessions:
-        session_day = getattr(session, "session_date", None)
-        if not isinstance(session_day, date):
-            continue
+    for row in rows:
+        session_day = row.session_date
 
-        try:
-            minutes = float(getattr(session, "playtime_minutes", 0) or 0)
-        except (TypeError, ValueError):
-            minutes = 0.0
-        if minutes <= 0:
-            continue
+        # Rows arrive ordered by session_date, so the covered range is just
+        # the first and latest dates seen.
+        if range_start is None:
+            range_start = session_day
+        range_end = session_day
+
+        minutes = float(row.playtime_minutes)
 
         window = _resolve_period_window(session_day, period)
         entry = timeline_map.setdefault(
             window.start,
             {
                 "window": window,
-                "sessions": [],
+                "sentiment": WeightedSentimentAccumulator(),
                 "total_minutes": 0.0,
-                "titles": defaultdict(float),
+                "titles": {},
                 "title_meta": {},
-                "genres": defaultdict(float),
-                "titles_set": set(),
+                "genres": {},
             },
         )
 
-        entry["sessions"].append(session)
+        entry["sentiment"].add(row.sentiment or "", minutes)
         entry["total_minutes"] += minutes
 
-        resolved_game = _resolve_game_for_session(
-            session, games_by_id=games_by_id, games_by_title=games_by_title
-        )
-        raw_title = (
-            getattr(resolved_game, "title", None)
-            or getattr(session, "game_title", None)
-            or "Unknown Title"
-        )
+        raw_title = row.resolved_title or row.game_title or "Unknown Title"
         display_title = str(raw_title).strip() or "Unknown Title"
-        resolved_game_id = getattr(resolved_game, "id", None) or getattr(
-            session, "game_id", None
-        )
-        title_key = (resolved_game_id, display_title.lower())
-        entry["titles"][title_key] += minutes
-        entry["titles_set"].add(title_key)
-        entry["title_meta"].setdefault(
-            title_key,
-            {
+        title_key = (row.game_id, display_title.lower())
+        titles = entry["titles"]
+        titles[title_key] = titles.get(title_key, 0.0) + minutes
+        title_meta = entry["title_meta"]
+        if title_key not in title_meta:
+            title_meta[title_key] = {
                 "title": display_title,
-                "game_id": resolved_game_id,
-            },
-        )
+                "game_id": row.game_id,
+            }
 
-        genres = _normalize_genres(getattr(resolved_game, "genres", None))
+        genres = _normalized_genres_from_raw(row.genres_raw)
         if genres:
             share = minutes / len(genres)
+            genre_minutes = entry["genres"]
             for genre in genres:
-                entry["genres"][genre] += share
+                genre_minutes[genre] = genre_minutes.get(genre, 0.0) + share
 
     timeline: List[Dict[str, Any]] = []
     for start_key in sorted(timeline_map.keys()):
         bucket = timeline_map[start_key]
         window = bucket["window"]
         total_minutes = bucket["total_minutes"]
-        sessions_for_period = bucket["sessions"]
-        sentiment_result = compute_weighted_sentiment(sessions_for_period)
-
-        sorted_titles = sorted(
-            (
-                {
-                    "minutes": minutes,
-                    "share": (minutes / total_minutes) if total_minutes else 0.0,
-                    "game_id": bucket["title_meta"][title_key]["game_id"],
-                    "title": bucket["title_meta"][title_key]["title"],
-                }
-                for title_key, minutes in bucket["titles"].items()
-            ),
-            key=lambda entry: entry["minutes"],
-            reverse=True,
+        sentiment_result = bucket["sentiment"].result()
+
+        # Only the top three titles (plus an Other roll-up) and five genres
+        # ship per period, so pick them with bounded heaps and build dicts
+        # for the winners only.
+        title_minutes = bucket["titles"]
+        title_meta = bucket["title_meta"]
+        top_items = nlargest(3, title_minutes.items(), key=lambda item: item[1])
+        top_titles: List[Dict[str, Any]] = [
+            {
+                "minutes": minutes,
+                "share": (minutes / total_minutes) if total_minutes else 0.0,
+                "game_id": title_meta[title_key]["game_id"],
+                "title": title_meta[title_key]["title"],
+            }
+            for title_key, minutes in top_items
+        ]
+        top_keys = {title_key for title_key, _ in top_items}
+        other_minutes = sum(
+            minutes
+            for title_key, minutes in title_minutes.items()
+            if title_key not in top_keys
         )
-
-        top_titles: List[Dict[str, Any]] = []
-        other_minutes = 0.0
-        for index, record in enumerate(sorted_titles):
-            if index < 3:
-                top_titles.append(record)
-            else:
-                other_minutes += record["minutes"]
         if other_minutes > 0:
             top_titles.append(
                 {
@@ -1145,34 +1378,48 @@ def summarize_engagement_trend(
                 }
             )
 
-        sorted_genres = sorted(
-            (
-                {
-                    "genre": genre,
-                    "minutes": minutes,
-                    "share": (minutes / total_minutes) if total_minutes else 0.0,
-                }
-                for genre, minutes in bucket["genres"].items()
-            ),
-            key=lambda entry: entry["minutes"],
-            reverse=True,
-        )[:5]
+        sorted_genres = [
+            {
+                "genre": genre,
+                "minutes": minutes,
+                "share": (minutes / total_minutes) if total_minutes else 0.0,
+            }
+            for genre, minutes in nlargest(
+                5, bucket["genres"].items(), key=lambda item: item[1]
+            )
+        ]
 
         timeline.append(
             {
-                "period_start": window.start.isoformat(),
-                "period_end": window.end.isoformat(),
+                "period_start": _iso_date(window.start),
+                "period_end": _iso_date(window.end),
                 "label": _format_period_label(window, period),
                 "total_minutes": total_minutes,
                 "average_sentiment": sentiment_result.weighted_score,
                 "sentiment_minutes": sentiment_result.weighted_minutes,
-                "active_titles": len(bucket["titles_set"]),
+                "active_titles": len(bucket["titles"]),
                 "top_titles": top_titles,
                 "top_genres": sorted_genres,
             }
         )
 
     callouts: List[Dict[str, Any]] = []
+
+    # Driver titles (top titles minus the Other roll-up) are computed at most
+    # once per period and only for periods that actually trigger a callout,
+    # instead of rebuilding the filtered list inside every detector branch.
+    driver_titles: List[List[Dict[str, Any]] | None] = [None] * len(timeline)
+
+    def _drivers(index: int) -> dict[str, Any]:
+        titles = driver_titles[index]
+        if titles is None:
+            titles = driver_titles[index] = [
+                driver
+                for driver in timeline[index]["top_titles"]
+                if driver["title"] != "Other Titles"
+            ]
+        return {"titles": titles, "genres": timeline[index]["top_genres"][:3]}
+
     for index in range(1, len(timeline)):
         current = timeline[index]
         previous = timeline[index - 1]
@@ -1197,14 +1444,7 @@ def summarize_engagement_trend(
                     "label": f"Playtime surged {percent_label} vs prior {period}",
                     "change_minutes": change_minutes,
                     "percent_change": percent_change,
-                    "drivers": {
-                        "titles": [
-                            driver
-                            for driver in current["top_titles"]
-                            if driver["title"] != "Other Titles"
-                        ],
-                        "genres": current["top_genres"][:3],
-                    },
+                    "drivers": _drivers(index),
                 }
             )
             continue
@@ -1224,18 +1464,11 @@ def summarize_engagement_trend(
                     "label": f"Engagement dipped {percent_label} vs prior {period}",
                     "change_minutes": change_minutes,
                     "percent_change": percent_change,
-                    "drivers": {
-                        "titles": [
-                            driver
-                            for driver in previous["top_titles"]
-                            if driver["title"] != "Other Titles"
-                        ],
-                        "genres": previous["top_genres"][:3],
-                    },
+                    "drivers": _drivers(index - 1),
                 }
             )
 
-    for period_entry in timeline:
+    for index, period_entry in enumerate(timeline):
         total_minutes = period_entry["total_minutes"]
         sentiment_score = period_entry["average_sentiment"] or 0.0
         if total_minutes >= 240 and sentiment_score <= 45:
@@ -1246,14 +1479,7 @@ def summarize_engagement_trend(
                     "label": "High playtime but low sentiment—consider rotating titles.",
                     "change_minutes": None,
                     "percent_change": None,
-                    "drivers": {
-                        "titles": [
-                            driver
-                            for driver in period_entry["top_titles"]
-                            if driver["title"] != "Other Titles"
-                        ],
-                        "genres": period_entry["top_genres"][:3],
-                    },
+                    "drivers": _drivers(index),
                 }
             )
 
@@ -1263,17 +1489,11 @@ def summarize_engagement_trend(
         "callouts": callouts,
     }
 
-    if sessions:
-        valid_dates = [
-            session.session_date
-            for session in sessions
-            if isinstance(session.session_date, date)
-        ]
-        if valid_dates:
-            response["range"] = {
-                "start": min(valid_dates).isoformat(),
-                "end": max(valid_dates).isoformat(),
-            }
+    if range_start is not None and range_end is not None:
+        response["range"] = {
+            "start": range_start.isoformat(),
+            "end": range_end.isoformat(),
+        }
 
     if start_date:
         response.setdefault("range", {})["requested_start"] = start_date.isoformat()
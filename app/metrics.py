@@ -17,6 +17,52 @@ class WeightedSentimentResult:
         return self.weighted_score is not None
 
 
+DEFAULT_SENTIMENT_WEIGHTS: Mapping[str, float] = {
+    "good": 100.0,
+    "mediocre": 50.0,
+    "bad": 0.0,
+}
+
+
+class WeightedSentimentAccumulator:
+    """Running weighted-sentiment totals that never buffer individual samples.
+
+    Callers feed already-normalized ``(sentiment, minutes)`` pairs via
+    :meth:`add` and read the final :class:`WeightedSentimentResult` once at
+    the end, so large session sets aggregate in constant memory.
+    """
+
+    __slots__ = ("total_minutes", "weighted_sum", "weighted_minutes", "_weights")
+
+    def __init__(self, sentiment_weights: Mapping[str, float] | None = None) -> None:
+        self.total_minutes = 0.0
+        self.weighted_sum = 0.0
+        self.weighted_minutes = 0.0
+        if sentiment_weights:
+            weights = dict(DEFAULT_SENTIMENT_WEIGHTS)
+            weights.update({k: float(v) for k, v in sentiment_weights.items()})
+            self._weights = weights
+        else:
+            self._weights = DEFAULT_SENTIMENT_WEIGHTS
+
+    def add(self, sentiment: str, minutes: float) -> None:
+        if minutes <= 0:
+            return
+        self.total_minutes += minutes
+        weight = self._weights.get(sentiment)
+        if weight is not None:
+            self.weighted_sum += weight * minutes
+            self.weighted_minutes += minutes
+
+    def result(self) -> WeightedSentimentResult:
+        weighted_score = (
+            self.weighted_sum / self.weighted_minutes if self.weighted_minutes else None
+        )
+        return WeightedSentimentResult(
+            weighted_score, self.total_minutes, self.weighted_minutes
+        )
+
+
 def compute_weighted_sentiment(
     session_rows: Iterable[object],
     *,
@@ -30,32 +76,14 @@ def compute_weighted_sentiment(
     contribute to the total minutes tracked.
     """
 
-    weights = {
-        "good": 100.0,
-        "mediocre": 50.0,
-        "bad": 0.0,
-    }
-    if sentiment_weights:
-        weights.update({k: float(v) for k, v in sentiment_weights.items()})
-
-    total_minutes = 0.0
-    weighted_sum = 0.0
-    total_weight = 0.0
-
+    accumulator = WeightedSentimentAccumulator(sentiment_weights)
+    # Bound method lookup happens once rather than per session.
+    add = accumulator.add
     for session in session_rows:
         try:
             minutes = float(getattr(session, "playtime_minutes", 0) or 0)
         except (TypeError, ValueError):
             minutes = 0.0
-        sentiment = str(getattr(session, "sentiment", "")).lower()
-
-        if minutes <= 0:
-            continue
-
-        total_minutes += minutes
-        if sentiment in weights:
-            weighted_sum += weights[sentiment] * minutes
-            total_weight += minutes
+        add(str(getattr(session, "sentiment", "")).lower(), minutes)
 
-    weighted_score = (weighted_sum / total_weight) if total_weight else None
-    return WeightedSentimentResult(weighted_score, total_minutes, total_weight)
+    return accumulator.result()
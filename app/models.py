@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
+from json import dumps, loads
 from typing import List
 
 from . import db
 
 
+@lru_cache(maxsize=512)
+def _decode_string_list(raw: str | None) -> tuple[str, ...]:
+    """Decode a JSON list payload once per distinct raw string.
+
+    Mode and genre payloads repeat across property reads (``to_dict``,
+    templates, serialization) and across games, so the parse runs once per
+    distinct payload instead of once per access. Malformed or non-list
+    payloads decode to an empty tuple.
+    """
+
+    if not raw:
+        return ()
+    try:
+        parsed = loads(raw)
+    except ValueError:
+        return ()
+    if not isinstance(parsed, list):
+        return ()
+    return tuple(parsed)
+
+
 class Game(db.Model):
     __tablename__ = "games"
 
@@ -66,26 +89,18 @@ class Game(db.Model):
 
     @property
     def modes(self) -> List[str]:
-        from json import loads
-
-        return loads(self.modes_raw or "[]")
+        return list(_decode_string_list(self.modes_raw))
 
     @modes.setter
     def modes(self, value: List[str]) -> None:
-        from json import dumps
-
         self.modes_raw = dumps(value or [])
 
     @property
     def genres(self) -> List[str]:
-        from json import loads
-
-        return loads(self.genres_raw or "[]")
+        return list(_decode_string_list(self.genres_raw))
 
     @genres.setter
     def genres(self, value: List[str]) -> None:
-        from json import dumps
-
         self.genres_raw = dumps(value or [])
 
 
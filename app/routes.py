@@ -18,13 +18,6 @@ from sqlalchemy import func, or_
 from sqlalchemy.exc import SQLAlchemyError
 
 from . import db
-from .insights import (
-    build_genre_interest_sentiment,
-    summarize_engagement_trend,
-    summarize_genre_preferences,
-    summarize_lifecycle_metrics,
-    summarize_price_insights,
-)
 from .models import Comparison, Game, SessionLog
 from .metrics import compute_weighted_sentiment
 from .statuses import (
@@ -323,18 +316,24 @@ def purge_all_data():
 
 @bp.route("/api/insights/genres")
 def insights_genre_summary():
+    from .insights import summarize_genre_preferences
+
     summary = summarize_genre_preferences()
     return jsonify(summary)
 
 
 @bp.route("/api/insights/genre-sentiment")
 def insights_genre_sentiment():
+    from .insights import build_genre_interest_sentiment
+
     summary = build_genre_interest_sentiment()
     return jsonify(summary)
 
 
 @bp.route("/api/insights/lifecycle")
 def insights_lifecycle_metrics():
+    from .insights import summarize_lifecycle_metrics
+
     summary = summarize_lifecycle_metrics()
     return jsonify(summary)
 
@@ -353,6 +352,8 @@ def insights_engagement_trend():
         except ValueError as exc:  # pragma: no cover - user input validation
             raise ValueError(f"{label} must be a valid YYYY-MM-DD date") from exc
 
+    from .insights import summarize_engagement_trend
+
     try:
         start_date = _parse_date(start_param, "start")
         end_date = _parse_date(end_param, "end")
@@ -367,6 +368,8 @@ def insights_engagement_trend():
 
 @bp.route("/api/insights/pricing")
 def insights_pricing_summary():
+    from .insights import summarize_price_insights
+
     summary = summarize_price_insights()
     return jsonify(summary)
 
@@ -1620,6 +1623,10 @@ def sessions_collection():
             game = Game.query.get(game_id)
             if game:
                 game_title = game.title
+        elif game_title:
+            game = Game.query.filter_by(title=game_title).first()
+            if game:
+                game_id = game.id
 
         if not game_title:
             return jsonify({"error": "Game title is required."}), 400
@@ -87,6 +87,69 @@ def test_summarize_genre_preferences_weights_multi_genre_games(app_instance):
     assert "playing" in summary["bucket_metadata"]
 
 
+def test_genre_sentiment_endpoint_combines_interest_and_sentiment(
+    app_instance, client
+):
+    with app_instance.app_context():
+        game_a = Game(title="Aurora Trails", status="playing", elo_rating=1600)
+        game_a.genres = ["RPG", "Adventure"]
+        game_b = Game(title="Nebula Forge", status="backlog", elo_rating=1500)
+        game_b.genres = ["RPG"]
+        db.session.add_all([game_a, game_b])
+        db.session.commit()
+
+        db.session.add_all(
+            [
+                SessionLog(
+                    game_id=game_a.id,
+                    game_title=game_a.title,
+                    session_date=date(2023, 5, 1),
+                    playtime_minutes=120,
+                    sentiment="good",
+                ),
+                SessionLog(
+                    game_id=game_a.id,
+                    game_title=game_a.title,
+                    session_date=date(2023, 5, 2),
+                    playtime_minutes=60,
+                    sentiment="bad",
+                ),
+                SessionLog(
+                    game_id=game_b.id,
+                    game_title=game_b.title,
+                    session_date=date(2023, 5, 3),
+                    playtime_minutes=90,
+                    sentiment="mediocre",
+                ),
+            ]
+        )
+        db.session.commit()
+
+    response = client.get("/api/insights/genre-sentiment")
+    assert response.status_code == 200
+    payload = response.get_json()
+
+    genres = {entry["genre"]: entry for entry in payload["genres"]}
+
+    # Each of game_a's sessions splits evenly across its two genres.
+    rpg = genres["RPG"]
+    assert rpg["sentiment"]["total_playtime_minutes"] == pytest.approx(180.0)
+    assert rpg["sentiment"]["weighted_sentiment"] == pytest.approx(10500.0 / 180.0)
+    assert rpg["sentiment"]["session_count"] == 3
+    assert rpg["sentiment"]["statuses"]["playing"][
+        "total_playtime_minutes"
+    ] == pytest.approx(90.0)
+    assert rpg["interest"]["average_elo"] == pytest.approx(1533.33, rel=1e-3)
+    assert rpg["interest"]["statuses"]["backlog"]["count"] == 1
+
+    adventure = genres["Adventure"]
+    assert adventure["sentiment"]["weighted_sentiment"] == pytest.approx(200.0 / 3.0)
+    assert adventure["interest"]["interest_score"] == pytest.approx(80.0)
+
+    assert payload["genres"][0]["genre"] == "RPG"
+    assert "backlog" in payload["bucket_metadata"]
+
+
 def test_summarize_lifecycle_metrics(app_instance):
     with app_instance.app_context():
         game_a = Game(
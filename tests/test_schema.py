@@ -0,0 +1,61 @@
+from sqlalchemy import inspect, text
+
+from app import (
+    _GAME_COLUMN_DEFINITIONS,
+    _INDEX_DEFINITIONS,
+    _schema_fingerprint,
+    create_app,
+    db,
+)
+
+
+def _boot(database_uri):
+    app = create_app(database_uri=database_uri)
+    app.config.update(TESTING=True)
+    return app
+
+
+def test_warm_boot_keeps_managed_schema(tmp_path):
+    database_file = tmp_path / "schema.db"
+    database_uri = f"sqlite:///{database_file}"
+
+    first = _boot(database_uri)
+    with first.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+    # Second boot against the same file takes the fingerprint early-return;
+    # the managed columns and indexes must still all be present.
+    second = _boot(database_uri)
+    with second.app_context():
+        stored_version = db.session.execute(text("PRAGMA user_version")).scalar()
+        assert stored_version == _schema_fingerprint()
+
+        inspector = inspect(db.engine)
+        columns = {column["name"] for column in inspector.get_columns("games")}
+        assert set(_GAME_COLUMN_DEFINITIONS) <= columns
+
+        index_names = {
+            index["name"]
+            for table in ("games", "session_logs")
+            for index in inspector.get_indexes(table)
+        }
+        assert set(_INDEX_DEFINITIONS) <= index_names
+
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_fingerprint_tracks_definition_changes(monkeypatch):
+    baseline = _schema_fingerprint()
+
+    monkeypatch.setitem(_GAME_COLUMN_DEFINITIONS, "thoughts", "VARCHAR(64)")
+    assert _schema_fingerprint() != baseline
+
+    changed_column_version = _schema_fingerprint()
+    monkeypatch.setitem(
+        _INDEX_DEFINITIONS,
+        "idx_games_lifecycle",
+        "CREATE INDEX IF NOT EXISTS idx_games_lifecycle ON games (status)",
+    )
+    assert _schema_fingerprint() != changed_column_version